@@ -1,29 +1,54 @@
 import streamlit as st
 import pandas as pd
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
 import numpy as np
 import io
 import json
+import functools
+import heapq
 from datetime import datetime
 from pathlib import Path
-import altair as alt
 import os
-import uuid
-import base64
+import secrets
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Fall back to the stdlib json module
+
+# matplotlib, altair and base64 are imported where they are used so that
+# sessions which never render those pages don't pay for the imports
 
 # ----------- Configuration -----------
 APP_VERSION = "1.1.0"
 CONFIG_FILE = "config.json"
 DATA_FOLDER = "data"
-DATA_FILE = os.path.join(DATA_FOLDER, "data.csv")
+DATA_FILE = os.path.join(DATA_FOLDER, "data.parquet")
+LEGACY_DATA_FILE = os.path.join(DATA_FOLDER, "data.csv")
+MIGRATED_DATA_FILE = LEGACY_DATA_FILE + ".migrated"  # Imported CSVs are moved here so they are only read once
 BACKUP_FOLDER = os.path.join(DATA_FOLDER, "backups")
+BACKUP_EXTENSIONS = (".parquet", ".csv")  # CSV backups come from earlier versions
 COLUMNS = [
     "ID", "Opportunity", "Related to", "Area", "Type", "Topic",
     "Impact", "Complexity", "Score", "Status", "Created", "Modified"
 ]
+# Columns read from CSV files (anything else in the file is skipped)
+_CSV_COLUMNS = COLUMNS + ["UUID"]
+# Explicit dtypes for the text columns; numeric columns are left to the C parser and coerced after reading
+_CSV_DTYPES = {
+    "Opportunity": "string",
+    "Related to": "string",
+    "Area": "string",
+    "Type": "string",
+    "Topic": "string",
+    "Status": "string",
+    "Created": "string",
+    "Modified": "string",
+    "UUID": "string"
+}
 STATUS_OPTIONS = ["Idea", "To explore", "Validated", "In development", "Deployed"]
 TYPE_OPTIONS = ["Enabler", "Lever"]
+HEATMAP_JITTER_SEED = 0  # Fixed seed keeps point positions stable across reruns
+HEATMAP_MAX_LABELS = 50  # Only the top-scoring points get an ID label
 
 # ----------- Setup -----------
 def initialize_folders():
@@ -44,21 +69,23 @@ def load_config():
     
     if config_path.exists():
         try:
-            with open(config_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            raw = config_path.read_bytes()
+            return orjson.loads(raw) if orjson is not None else json.loads(raw)
         except Exception as e:
             st.error(f"Error loading config: {e}")
             return default_config
     else:
         # Create default config file
-        with open(config_path, 'w', encoding='utf-8') as f:
-            json.dump(default_config, f, indent=4)
+        save_config(default_config)
         return default_config
 
 def save_config(config):
     """Save configuration to JSON file"""
-    with open(CONFIG_FILE, 'w', encoding='utf-8') as f:
-        json.dump(config, f, indent=4)
+    if orjson is not None:
+        raw = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+    else:
+        raw = json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
+    Path(CONFIG_FILE).write_bytes(raw)
 
 # ----------- Translation System -----------
 TRANSLATIONS = {
@@ -92,83 +119,170 @@ TRANSLATIONS = {
     }
 }
 
+_EN = TRANSLATIONS["en"]
+
 def get_text(key, lang):
     """Get translated text"""
-    try:
-        return TRANSLATIONS[lang][key]
-    except KeyError:
-        # Fallback to English if translation not found
-        try:
-            return TRANSLATIONS["en"][key]
-        except KeyError:
-            return key  # Return the key itself if no translation exists
+    # Fallback to English if translation not found, then to the key itself
+    return TRANSLATIONS.get(lang, _EN).get(key) or _EN.get(key, key)
 
 # ----------- Data Management Functions -----------
-@st.cache_data(ttl=300)
+def current_timestamp():
+    """Current time formatted for the Created/Modified columns"""
+    return datetime.now().strftime("%Y-%m-%d %H:%M")
+
 def compute_score(impact, complexity):
     """Calculate priority score"""
     return round((impact + (10 - complexity)) / 2, 1)
 
-def create_backup(df):
-    """Create a backup of the current data"""
+def scan_backups():
+    """List backup files as (mtime, path) pairs using a single directory scan"""
+    with os.scandir(BACKUP_FOLDER) as entries:
+        return [(entry.stat().st_mtime, entry.path) for entry in entries if entry.name.endswith(BACKUP_EXTENSIONS)]
+
+def create_backup(df, prefix="data_backup"):
+    """Create a backup of the current data and return its path"""
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    backup_file = os.path.join(BACKUP_FOLDER, f"data_backup_{timestamp}.csv")
-    df.to_csv(backup_file, index=False)
+    backup_file = os.path.join(BACKUP_FOLDER, f"{prefix}_{timestamp}.parquet")
+    df.to_parquet(backup_file, engine='pyarrow', compression='zstd', index=False)
     
-    # Keep only the 10 most recent backups
-    backups = sorted(Path(BACKUP_FOLDER).glob("*.csv"), key=os.path.getmtime, reverse=True)
-    for old_backup in backups[10:]:
+    # Keep only the 10 most recent backups (only the oldest need to be found, not a full sort)
+    backups = scan_backups()
+    for _, old_backup in heapq.nsmallest(max(len(backups) - 10, 0), backups):
         try:
-            old_backup.unlink()
-        except:
+            os.remove(old_backup)
+        except OSError:
             pass
+    
+    return backup_file
+
+def read_backup(source):
+    """Read a backup file (path or uploaded file) in either of the supported formats"""
+    if str(getattr(source, "name", source)).endswith(".parquet"):
+        return pd.read_parquet(source)
+    return read_csv_data(source)
+
+def categorize_columns(df):
+    """Store the low-cardinality text columns as categoricals"""
+    for col, options in [("Status", STATUS_OPTIONS), ("Type", TYPE_OPTIONS)]:
+        # Keep values outside the fixed options instead of turning them into NaN
+        extra = sorted(set(df[col].dropna()) - set(options))
+        df[col] = pd.Categorical(df[col], categories=options + extra)
+    for col in ["Area", "Topic"]:
+        df[col] = df[col].astype("category").cat.remove_unused_categories()
+    return df
+
+def add_missing_categories(df, values):
+    """Extend categorical columns so the given column values can be assigned"""
+    for col, value in values.items():
+        if isinstance(df[col].dtype, pd.CategoricalDtype) and value not in df[col].cat.categories:
+            df[col] = df[col].cat.add_categories([value])
+
+@st.cache_data(max_entries=1, show_spinner=False)  # Only the current file version can be hit again
+def _load_data_cached(path, mtime_ns):
+    """Read and normalize the data file (mtime_ns is only part of the cache key)"""
+    df = pd.read_parquet(path)
+    # Ensure all required columns exist
+    for col in COLUMNS:
+        if col not in df.columns:
+            if col in ["Created", "Modified"]:
+                df[col] = current_timestamp()
+            else:
+                df[col] = None
+    
+    # Rows need a stable key since IDs are only the current score rank
+    if "UUID" not in df.columns:
+        df["UUID"] = None
+    missing_uuid = df["UUID"].isna()
+    if missing_uuid.any():
+        df.loc[missing_uuid, "UUID"] = [generate_unique_id() for _ in range(missing_uuid.sum())]
+    
+    # Fill any NaN values (Parquet keeps categoricals, which must know the fill values)
+    add_missing_categories(df, {
+        "Area": "", "Type": TYPE_OPTIONS[0], "Topic": "", "Status": STATUS_OPTIONS[0]
+    })
+    df = df.fillna({
+        "ID": 0,
+        "Opportunity": "",
+        "Related to": "",
+        "Area": "",
+        "Type": TYPE_OPTIONS[0],
+        "Topic": "",
+        "Impact": 5.0,
+        "Complexity": 5.0,
+        "Score": 5.0,
+        "Status": STATUS_OPTIONS[0]
+    })
+    
+    return categorize_columns(df)
+
+def read_csv_data(source):
+    """Read opportunities from a CSV file or buffer with known dtypes"""
+    df = pd.read_csv(source, dtype=_CSV_DTYPES, usecols=lambda c: c in _CSV_COLUMNS)
+    
+    # Convert string columns that should be numeric (a no-op unless a bad cell made the column object)
+    for col in ["Impact", "Complexity", "Score"]:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').round(1)
+    
+    # IDs are recomputed from the score rank; values that are not usable integers become NA
+    if "ID" in df.columns:
+        ids = pd.to_numeric(df["ID"], errors='coerce').round()
+        df["ID"] = ids.where(ids.abs() <= np.iinfo(np.int32).max).astype("Int32")
+    
+    return df
+
+def migrate_legacy_data():
+    """Import a data.csv (earlier versions' store, or one dropped in by hand) into the Parquet file"""
+    df = read_csv_data(LEGACY_DATA_FILE)
+    
+    # Keep the data being replaced so an unexpected import can be undone from Settings
+    if Path(DATA_FILE).exists():
+        create_backup(pd.read_parquet(DATA_FILE), prefix="pre_import_backup")
+    
+    df.to_parquet(DATA_FILE, engine='pyarrow', compression='zstd', index=False)
+    os.replace(LEGACY_DATA_FILE, MIGRATED_DATA_FILE)
 
 def load_data():
-    """Load data from CSV file with error handling"""
+    """Load data from Parquet file with error handling"""
     try:
+        # Import the CSV if one is present (it is moved aside afterwards)
+        if Path(LEGACY_DATA_FILE).exists():
+            try:
+                migrate_legacy_data()
+            except Exception as e:
+                # Continuing with an empty frame would let the next save overwrite the data
+                st.error(f"Error migrating {LEGACY_DATA_FILE}: {e}")
+                st.stop()
+        
         if Path(DATA_FILE).exists():
-            df = pd.read_csv(DATA_FILE)
-            # Ensure all required columns exist
-            for col in COLUMNS:
-                if col not in df.columns:
-                    if col in ["Created", "Modified"]:
-                        df[col] = datetime.now().strftime("%Y-%m-%d %H:%M")
-                    else:
-                        df[col] = None
-            
-            # Convert string columns that should be numeric
-            for col in ["Impact", "Complexity", "Score"]:
-                df[col] = pd.to_numeric(df[col], errors='coerce').round(1)
-                
-            # Fill any NaN values
-            df = df.fillna({
-                "ID": 0,
-                "Opportunity": "",
-                "Related to": "",
-                "Area": "",
-                "Type": TYPE_OPTIONS[0],
-                "Topic": "",
-                "Impact": 5.0,
-                "Complexity": 5.0,
-                "Score": 5.0,
-                "Status": STATUS_OPTIONS[0]
-            })
-            
-            return df
+            # Passing the modification time busts the cache whenever the file is saved
+            # (nanoseconds, so two writes within the same float mtime tick still differ)
+            return _load_data_cached(DATA_FILE, os.stat(DATA_FILE).st_mtime_ns)
         else:
             return pd.DataFrame(columns=COLUMNS)
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return pd.DataFrame(columns=COLUMNS)
 
+def hash_frame(df):
+    """Cheap content hash of a DataFrame (column names and values, ignoring the index)"""
+    return hash((tuple(df.columns), pd.util.hash_pandas_object(df, index=False).values.tobytes()))
+
 def save_data(df):
-    """Save data to CSV file with error handling"""
+    """Save data to Parquet file with error handling"""
     try:
+        # Skip the write if nothing changed since the last save (e.g. a resubmitted form)
+        content_hash = hash_frame(df)
+        if content_hash == st.session_state.get("_last_saved_hash") and Path(DATA_FILE).exists():
+            return True
+        
         # Create folder if not exists
         os.makedirs(os.path.dirname(DATA_FILE), exist_ok=True)
         
         # Save data
-        df.to_csv(DATA_FILE, index=False)
+        df.to_parquet(DATA_FILE, engine='pyarrow', compression='zstd', index=False)
+        st.session_state._last_saved_hash = content_hash
         
         # Initialize save_counter if not exists
         if "save_counter" not in st.session_state:
@@ -190,15 +304,13 @@ def save_data(df):
         return False
 
 def refresh_data(df):
-    """Sort data by score and update IDs"""
-    df = df.sort_values(by="Score", ascending=False).reset_index(drop=True)
-    df["ID"] = range(1, len(df) + 1)
-    df["Modified"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+    """Update IDs to the score rank without reordering rows (sorting happens at display time)"""
+    df["ID"] = df["Score"].rank(method="first", ascending=False).astype(int)
     return df
 
 def generate_unique_id():
     """Generate a unique identifier for opportunities"""
-    return str(uuid.uuid4())[:8]
+    return secrets.token_hex(4)
 
 # ----------- UI Helpers -----------
 def create_color_scale():
@@ -218,15 +330,20 @@ def add_logo():
     if Path(logo_path).exists():
         st.sidebar.image(logo_path, width=100)
 
-def display_score_indicator(score, size=100):
-    """Display a circular indicator for the score with improved styling"""
-    fig, ax = plt.subplots(figsize=(size/100, size/100))
+@functools.lru_cache(maxsize=512)
+def _render_indicator_png(score, size=100):
+    """Render a circular indicator for the score as PNG bytes (memoized per score and size)"""
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Circle
+    
+    fig = Figure(figsize=(size/100, size/100))
+    ax = fig.subplots()
     
     # Set figure facecolor to transparent
     fig.patch.set_alpha(0.0)
     
     # Set the background circle
-    background = plt.Circle((0.5, 0.5), 0.45, color='none')
+    background = Circle((0.5, 0.5), 0.45, color='none')
     
     # Set the score circle color based on value
     if score >= 8:
@@ -236,26 +353,225 @@ def display_score_indicator(score, size=100):
     else:
         color = '#f8d3d3'  # Red
     
-    score_circle = plt.Circle((0.5, 0.5), 0.45, color=color)
+    score_circle = Circle((0.5, 0.5), 0.45, color=color)
     
     ax.add_patch(background)
     ax.add_patch(score_circle)
     
     # Add the score text
-    plt.text(0.5, 0.5, f"{score}", 
-             horizontalalignment='center',
-             verticalalignment='center',
-             fontsize=size/6, fontweight='bold', color='black')
+    ax.text(0.5, 0.5, f"{score}", 
+            horizontalalignment='center',
+            verticalalignment='center',
+            fontsize=size/6, fontweight='bold', color='black')
     
     ax.set_xlim(0, 1)
     ax.set_ylim(0, 1)
-    plt.axis('off')
-    plt.tight_layout()
+    ax.axis('off')
+    fig.tight_layout()
+    
+    # Same output settings as st.pyplot; the figure is not registered with pyplot so nothing to close
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=200, bbox_inches='tight', transparent=True)
     
-    return fig
+    return buf.getvalue()
+
+@st.cache_data(show_spinner=False)
+def _status_chart(status_counts, status_options):
+    """Build the status distribution bar chart spec from (status, count) pairs"""
+    import altair as alt
+    
+    chart_data = pd.DataFrame(status_counts, columns=["Status", "Count"])
+    return alt.Chart(chart_data).mark_bar().encode(
+        x=alt.X('Status:N', sort=list(status_options)),
+        y='Count:Q',
+        color=alt.Color('Status:N', scale=alt.Scale(scheme='category10'))
+    ).properties(height=200).to_dict()
+
+@st.cache_data(show_spinner=False)
+def _priority_chart(priority_counts, order):
+    """Build the priority distribution bar chart spec from (priority, count) pairs"""
+    import altair as alt
+    
+    chart_data = pd.DataFrame(priority_counts, columns=["Priority", "Count"])
+    return alt.Chart(chart_data).mark_bar().encode(
+        x=alt.X('Priority:N', sort=list(order)),
+        y='Count:Q',
+        color=alt.Color('Priority:N', scale=alt.Scale(
+            domain=['High', 'Medium-High', 'Medium-Low', 'Low'],
+            range=['#c6f5d3', '#d4f5b3', '#fff3b3', '#f8d3d3']
+        ))
+    ).properties(height=300).to_dict()
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _render_heatmap_png(data_hash, _data):
+    """Render the Impact vs Complexity heatmap as (display, download) PNG bytes.
+    
+    Streamlit caches on data_hash only; the leading underscore keeps _data out of the key.
+    """
+    from matplotlib.figure import Figure
+    from matplotlib.colors import to_rgba
+    from matplotlib.lines import Line2D
+    
+    # Improved heatmap (built with the OO API so it is never registered with pyplot)
+    fig = Figure(figsize=(10, 8))
+    ax = fig.subplots()
+    ax.set_xlim(-0.5, 10.5)
+    ax.set_ylim(-0.5, 10.5)
+    ax.set_xlabel("Complexity", fontsize=12)
+    ax.set_ylabel("Impact", fontsize=12)
+    ax.set_title("Impact vs Complexity Heatmap", fontsize=14, fontweight='bold')
+    ax.set_xticks(range(11))
+    ax.set_yticks(range(11))
+    ax.grid(True, linestyle='--', alpha=0.3)
+    
+    # Background zones drawn as one 2x2 image (rows are Impact low/high, columns Complexity low/high)
+    # Green zone - high impact, low complexity (prioritize)
+    # Orange zone - low impact, high complexity (deprioritize)
+    # Yellow zone - everything else (evaluate)
+    zones = np.array([
+        [to_rgba('#FFF5B1', 0.3), to_rgba('#F9C6A8', 0.3)],
+        [to_rgba('#A8D5BA', 0.3), to_rgba('#FFF5B1', 0.3)]
+    ])
+    ax.imshow(zones, extent=(0, 10, 0, 10), origin='lower', aspect='auto', interpolation='nearest')
+    ax.set_xlim(-0.5, 10.5)  # imshow resets the limits to its extent
+    ax.set_ylim(-0.5, 10.5)
+    ax.text(2.5, 7.5, "HIGH PRIORITY", ha='center', va='center', fontweight='bold', alpha=0.5, fontsize=14)
+    ax.text(7.5, 2.5, "LOW PRIORITY", ha='center', va='center', fontweight='bold', alpha=0.5, fontsize=14)
+    
+    # Plot opportunities with jitter to avoid overlap
+    points = _data[["Complexity", "Impact", "ID"]].to_numpy(dtype=float)
+    rng = np.random.default_rng(HEATMAP_JITTER_SEED)
+    jitter_x = points[:, 0] + rng.uniform(-0.15, 0.15, len(points))
+    jitter_y = points[:, 1] + rng.uniform(-0.15, 0.15, len(points))
+    
+    # Use color coding by status
+    status_colors = {
+        "Idea": "lightgray",
+        "To explore": "skyblue",
+        "Validated": "orange",
+        "In development": "purple",
+        "Deployed": "green"
+    }
+    
+    # Default color for any status not in the dictionary
+    colors = _data["Status"].astype(object).map(status_colors).fillna("gray").tolist()
+    
+    # Size based on score
+    #sizes = _data["Score"] * 200
+    sizes = 1000
+    
+    scatter = ax.scatter(
+        jitter_x, jitter_y, 
+        s=sizes, 
+        c=colors,
+        edgecolors='black', 
+        linewidth=1.2, 
+        alpha=0.9
+    )
+    
+    # Add ID labels for the highest scores only to bound the number of Text artists
+    label_idx = np.argsort(-_data["Score"].to_numpy(), kind='stable')[:HEATMAP_MAX_LABELS]
+    for i in label_idx:
+        ax.text(jitter_x[i], jitter_y[i], str(int(points[i, 2])), 
+               fontsize=9, ha='center', va='center', 
+               weight='bold', color='white')
+    
+    # Add legend for status colors
+    legend_elements = [
+        Line2D([0], [0], marker='o', color='w', markerfacecolor=color, 
+               label=status, markersize=10)
+        for status, color in status_colors.items() 
+        if status in _data["Status"].values
+    ]
+    
+    ax.legend(handles=legend_elements, title="Status", 
+             loc='upper left', bbox_to_anchor=(1, 1))
+    
+    fig.tight_layout()
+    
+    # Same settings st.pyplot used for display, plus a high resolution copy for download
+    display_buf = io.BytesIO()
+    fig.savefig(display_buf, format='png', dpi=200, bbox_inches='tight')
+    download_buf = io.BytesIO()
+    fig.savefig(download_buf, format='png', dpi=300, bbox_inches='tight')
+    
+    return display_buf.getvalue(), download_buf.getvalue()
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _render_status_donut_png(status_counts):
+    """Render the status donut chart from (status, count) pairs as PNG bytes"""
+    from matplotlib.figure import Figure
+    from matplotlib.patches import Circle
+    
+    statuses = [status for status, _ in status_counts]
+    counts = [count for _, count in status_counts]
+    
+    fig = Figure(figsize=(8, 8))
+    ax = fig.subplots()
+    
+    # Custom colors for each status
+    status_colors_pie = {
+        "Idea": "#aaaaaa",
+        "To explore": "#6baed6",
+        "Validated": "#fd8d3c",
+        "In development": "#9e9ac8",
+        "Deployed": "#74c476"
+    }
+    
+    # Map colors to the statuses in our data
+    colors = [status_colors_pie.get(s, "#999999") for s in statuses]
+    
+    # Create donut chart
+    wedges, texts, autotexts = ax.pie(
+        counts, 
+        labels=statuses,
+        colors=colors,
+        autopct='%1.1f%%',
+        startangle=90,
+        wedgeprops={'edgecolor': 'white', 'linewidth': 2}
+    )
+    
+    # Make donut hole
+    circle = Circle((0, 0), 0.4, fc='white')
+    ax.add_artist(circle)
+    
+    # Equal aspect ratio ensures that pie is drawn as a circle
+    ax.set_aspect('equal')
+    
+    # Style the text
+    for text in texts:
+        text.set_fontsize(12)
+        text.set_fontweight('bold')
+    
+    for autotext in autotexts:
+        autotext.set_fontsize(10)
+        autotext.set_fontweight('bold')
+        autotext.set_color('white')
+    
+    ax.set_title('Status Distribution', fontsize=16, pad=20)
+    
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', dpi=200, bbox_inches='tight')
+    
+    return buf.getvalue()
+
+def _json_default(value):
+    """Serialize the missing-value markers of nullable pandas columns as null"""
+    if value is pd.NA or value is pd.NaT:
+        return None
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+@st.cache_data(max_entries=8, show_spinner=False)
+def _export_json(data_hash, _data):
+    """Serialize the export rows as indented JSON records (cached on data_hash)"""
+    if orjson is not None:
+        return orjson.dumps(_data.to_dict(orient='records'), default=_json_default, option=orjson.OPT_INDENT_2)
+    return _data.to_json(orient='records', indent=2)
 
 def get_download_link(data, filename, text):
     """Generate a download link for data"""
+    import base64
+    
     b64 = base64.b64encode(data).decode()
     href = f'<a href="data:file/csv;base64,{b64}" download="{filename}">{text}</a>'
     return href
@@ -267,59 +583,40 @@ def dashboard_page(data, lang="en"):
     
     # KPIs
     if not data.empty:
-        # Top stats in cards with colored backgrounds
+        # Top stats in cards
         col1, col2, col3, col4 = st.columns(4)
         
-        # Calculate zones
-        green_zone = data[(data["Impact"] >= 5) & (data["Complexity"] <= 4)].shape[0]
-        orange_zone = data[(data["Impact"] <= 4) & (data["Complexity"] >= 5)].shape[0]
+        # Calculate zones on the raw arrays, reading each column once
+        impact = data["Impact"].to_numpy()
+        complexity = data["Complexity"].to_numpy()
+        green_zone = np.count_nonzero((impact >= 5) & (complexity <= 4))
+        orange_zone = np.count_nonzero((impact <= 4) & (complexity >= 5))
         yellow_zone = len(data) - green_zone - orange_zone
         
-        with col1:
-            st.markdown(f"""
-            <div style='background-color: #e3f6ff; padding: 10px; border-radius: 5px;'>
-                <h3 style='text-align: center; margin: 0;'>{len(data)}</h3>
-                <p style='text-align: center; margin: 0;'>Total Opportunities</p>
-            </div>
-            """, unsafe_allow_html=True)
+        # Status counts are shared by the chart and the progress bars
+        status_counts = data["Status"].value_counts()
+        # Categorical counts include unused statuses; keep them out of the chart
+        status_counts = status_counts[status_counts > 0]
         
-        with col2:
-            avg_score = data['Score'].mean() if not data.empty else 0
-            st.markdown(f"""
-            <div style='background-color: #f5f5f5; padding: 10px; border-radius: 5px;'>
-                <h3 style='text-align: center; margin: 0;'>{avg_score:.2f}</h3>
-                <p style='text-align: center; margin: 0;'>Average Score</p>
-            </div>
-            """, unsafe_allow_html=True)
+        avg_score = data['Score'].mean() if not data.empty else 0
         
-        with col3:
-            st.markdown(f"""
-            <div style='background-color: #c6f5d3; padding: 10px; border-radius: 5px;'>
-                <h3 style='text-align: center; margin: 0;'>{green_zone}</h3>
-                <p style='text-align: center; margin: 0;'>High Priority</p>
-            </div>
-            """, unsafe_allow_html=True)
-        
-        with col4:
-            st.markdown(f"""
-            <div style='background-color: #f8d3d3; padding: 10px; border-radius: 5px;'>
-                <h3 style='text-align: center; margin: 0;'>{orange_zone}</h3>
-                <p style='text-align: center; margin: 0;'>Low Priority</p>
-            </div>
-            """, unsafe_allow_html=True)
+        # Native metrics in bordered containers (no raw HTML to sanitize)
+        with col1.container(border=True):
+            st.metric("Total Opportunities", len(data))
         
-        # Status Distribution
-        st.subheader("Status Distribution")
-        status_counts = data["Status"].value_counts().reset_index()
-        status_counts.columns = ["Status", "Count"]
+        with col2.container(border=True):
+            st.metric("Average Score", f"{avg_score:.2f}")
+        
+        with col3.container(border=True):
+            st.metric("High Priority", green_zone)
         
-        status_chart = alt.Chart(status_counts).mark_bar().encode(
-            x=alt.X('Status:N', sort=STATUS_OPTIONS),
-            y='Count:Q',
-            color=alt.Color('Status:N', scale=alt.Scale(scheme='category10'))
-        ).properties(height=200)
+        with col4.container(border=True):
+            st.metric("Low Priority", orange_zone)
         
-        st.altair_chart(status_chart, use_container_width=True)
+        # Status Distribution
+        st.subheader("Status Distribution")
+        status_chart = _status_chart(tuple(status_counts.items()), tuple(STATUS_OPTIONS))
+        st.vega_lite_chart(spec=status_chart, use_container_width=True)
         
         # Top opportunities
         st.subheader("Top Opportunities")
@@ -344,9 +641,9 @@ def dashboard_page(data, lang="en"):
         
         # Calculate progress percentages by status
         total = len(data)
-        deployed_pct = len(data[data["Status"] == "Deployed"]) / total * 100 if total > 0 else 0
-        development_pct = len(data[data["Status"] == "In development"]) / total * 100 if total > 0 else 0
-        validated_pct = len(data[data["Status"] == "Validated"]) / total * 100 if total > 0 else 0
+        deployed_pct = status_counts.get("Deployed", 0) / total * 100 if total > 0 else 0
+        development_pct = status_counts.get("In development", 0) / total * 100 if total > 0 else 0
+        validated_pct = status_counts.get("Validated", 0) / total * 100 if total > 0 else 0
         
         col1, col2, col3 = st.columns(3)
         
@@ -411,7 +708,7 @@ def management_page(data, lang="en"):
             with col_score:
                 st.metric("Score", score)
             with col_viz:
-                st.pyplot(display_score_indicator(score, size=80))
+                st.image(_render_indicator_png(round(score, 1), 80))
             
             status = st.selectbox("Status", STATUS_OPTIONS)
         
@@ -419,10 +716,10 @@ def management_page(data, lang="en"):
             if not opportunity:
                 st.error("Opportunity description is required")
             else:
-                timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
+                timestamp = current_timestamp()
                 unique_id = generate_unique_id()
                 
-                new_row = pd.DataFrame([{
+                new_row = {
                     "ID": None,  # Will be assigned during refresh
                     "Opportunity": opportunity,
                     "Related to": related_to,
@@ -436,14 +733,23 @@ def management_page(data, lang="en"):
                     "Created": timestamp,
                     "Modified": timestamp,
                     "UUID": unique_id  # Added for tracking even if ID changes
-                }])
+                }
                 
-                st.session_state.data = pd.concat([data, new_row], ignore_index=True)
-                st.session_state.data = refresh_data(st.session_state.data)
+                if data.empty:
+                    # An empty frame has no dtypes to keep; build it from the row
+                    data = pd.DataFrame([new_row])
+                else:
+                    # Append in place (no concat copy) so the categorical dtypes are kept
+                    add_missing_categories(data, {
+                        "Area": area, "Type": type_, "Topic": topic, "Status": status
+                    })
+                    data.loc[len(data), list(new_row)] = list(new_row.values())
+                
+                st.session_state.data = refresh_data(data)
                 if save_data(st.session_state.data):
                     st.success("✅ Opportunity added successfully!")
                     # Show details of added item
-                    st.json(new_row.to_dict('records')[0])
+                    st.json(new_row)
                     st.rerun()
     
     # Edit existing opportunity
@@ -519,8 +825,7 @@ def management_page(data, lang="en"):
                              delta_color="normal")
                 
                 with col_viz:
-                    score_fig = display_score_indicator(score, size=100)
-                    st.pyplot(score_fig)
+                    st.image(_render_indicator_png(round(score, 1), 100))
                 
                 # Add score interpretation
                 if score >= 8:
@@ -537,20 +842,18 @@ def management_page(data, lang="en"):
                 if not opportunity:
                     st.error("Opportunity description is required")
                 else:
-                    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
-                    mask = st.session_state.data["ID"] == row["ID"]
+                    timestamp = current_timestamp()
+                    mask = st.session_state.data["UUID"] == row["UUID"]
                     
-                    # Update all fields
-                    st.session_state.data.loc[mask, "Opportunity"] = opportunity
-                    st.session_state.data.loc[mask, "Related to"] = related_to
-                    st.session_state.data.loc[mask, "Area"] = area
-                    st.session_state.data.loc[mask, "Type"] = type_
-                    st.session_state.data.loc[mask, "Topic"] = topic
-                    st.session_state.data.loc[mask, "Impact"] = impact
-                    st.session_state.data.loc[mask, "Complexity"] = complexity
-                    st.session_state.data.loc[mask, "Score"] = score
-                    st.session_state.data.loc[mask, "Status"] = status
-                    st.session_state.data.loc[mask, "Modified"] = timestamp
+                    # Update all fields in a single indexer pass
+                    cols = ["Opportunity", "Related to", "Area", "Type", "Topic",
+                            "Impact", "Complexity", "Score", "Status", "Modified"]
+                    vals = [opportunity, related_to, area, type_, topic,
+                            impact, complexity, score, status, timestamp]
+                    add_missing_categories(st.session_state.data, {
+                        "Area": area, "Type": type_, "Topic": topic, "Status": status
+                    })
+                    st.session_state.data.loc[mask, cols] = vals
                     
                     st.session_state.data = refresh_data(st.session_state.data)
                     if save_data(st.session_state.data):
@@ -576,7 +879,7 @@ def management_page(data, lang="en"):
                     create_backup(st.session_state.data)
                     
                     # Perform deletion
-                    st.session_state.data = st.session_state.data[st.session_state.data["ID"] != delete_id]
+                    st.session_state.data = st.session_state.data[st.session_state.data["ID"] != delete_id].reset_index(drop=True)
                     st.session_state.data = refresh_data(st.session_state.data)
                     if save_data(st.session_state.data):
                         st.success(f"🗑️ Opportunity ID {delete_id} deleted.")
@@ -611,30 +914,29 @@ def visualization_page(data, lang="en"):
                 default=data["Status"].dropna().unique() if not data.empty else []
             )
     
-    # Apply filters
+    # Apply filters as one combined mask (indexing with it already returns a new frame)
     if not data.empty:
-        filtered_data = data.copy()
+        mask = pd.Series(True, index=data.index)
         
         if types:
-            filtered_data = filtered_data[filtered_data["Type"].isin(types)]
+            mask &= data["Type"].isin(types)
         if areas:
-            filtered_data = filtered_data[filtered_data["Area"].isin(areas)]
+            mask &= data["Area"].isin(areas)
         if status_filter:
-            filtered_data = filtered_data[filtered_data["Status"].isin(status_filter)]
+            mask &= data["Status"].isin(status_filter)
+        
+        filtered_data = data[mask]
     else:
         filtered_data = data
     
     # Display filtered data with improved formatting
     st.subheader("📋 Filtered Opportunities")
     if not filtered_data.empty:
-        # Color coding function
-        def color_score(val):
-            if val > 8:
-                return 'background-color: #c6f5d3'
-            elif val >= 6:
-                return 'background-color: #fff3b3'
-            else:
-                return 'background-color: #f8d3d3'
+        # Color coding function, applied to the whole Score column at once
+        def color_score(scores):
+            values = scores.to_numpy()
+            return np.where(values > 8, 'background-color: #c6f5d3',
+                            np.where(values >= 6, 'background-color: #fff3b3', 'background-color: #f8d3d3'))
         
         # Add emoji indicators for status
         def add_status_emoji(status):
@@ -647,10 +949,10 @@ def visualization_page(data, lang="en"):
             }
             return f"{emoji_map.get(status, '')} {status}"
         
-        display_df = filtered_data.copy()
+        display_df = filtered_data.sort_values("Score", ascending=False, kind="mergesort")
         display_df["Status"] = display_df["Status"].apply(add_status_emoji)
         
-        styled_df = display_df.style.applymap(color_score, subset=["Score"])
+        styled_df = display_df.style.apply(color_score, subset=["Score"])
         st.dataframe(styled_df, use_container_width=True, hide_index=True)
     else:
         st.info("No data matching the filters")
@@ -662,92 +964,16 @@ def visualization_page(data, lang="en"):
         with chart_tabs[0]:
             st.subheader("📊 Impact vs Complexity Heatmap")
             
-            # Improved heatmap
-            fig, ax = plt.subplots(figsize=(10, 8))
-            ax.set_xlim(-0.5, 10.5)
-            ax.set_ylim(-0.5, 10.5)
-            ax.set_xlabel("Complexity", fontsize=12)
-            ax.set_ylabel("Impact", fontsize=12)
-            ax.set_title("Impact vs Complexity Heatmap", fontsize=14, fontweight='bold')
-            ax.set_xticks(range(11))
-            ax.set_yticks(range(11))
-            ax.grid(True, linestyle='--', alpha=0.3)
-            
-            # Background zones with better coloring and labels
-            # Green zone - high impact, low complexity (prioritize)
-            rect1 = patches.Rectangle((0, 5), 5, 5, facecolor='#A8D5BA', alpha=0.3, edgecolor='none')
-            ax.add_patch(rect1)
-            ax.text(2.5, 7.5, "HIGH PRIORITY", ha='center', va='center', fontweight='bold', alpha=0.5, fontsize=14)
-            
-            # Orange zone - low impact, high complexity (deprioritize)
-            rect2 = patches.Rectangle((5, 0), 5, 5, facecolor='#F9C6A8', alpha=0.3, edgecolor='none')
-            ax.add_patch(rect2)
-            ax.text(7.5, 2.5, "LOW PRIORITY", ha='center', va='center', fontweight='bold', alpha=0.5, fontsize=14)
-            
-            # Yellow zone - everything else (evaluate)
-            rect3 = patches.Rectangle((0, 0), 5, 5, facecolor='#FFF5B1', alpha=0.3, edgecolor='none')
-            ax.add_patch(rect3)
-            rect4 = patches.Rectangle((5, 5), 5, 5, facecolor='#FFF5B1', alpha=0.3, edgecolor='none')
-            ax.add_patch(rect4)
-            
-            # Plot opportunities with jitter to avoid overlap
-            jitter_x = filtered_data["Complexity"] + np.random.uniform(-0.15, 0.15, len(filtered_data))
-            jitter_y = filtered_data["Impact"] + np.random.uniform(-0.15, 0.15, len(filtered_data))
-            
-            # Use color coding by status
-            status_colors = {
-                "Idea": "lightgray",
-                "To explore": "skyblue",
-                "Validated": "orange",
-                "In development": "purple",
-                "Deployed": "green"
-            }
-            
-            # Default color for any status not in the dictionary
-            colors = [status_colors.get(status, "gray") for status in filtered_data["Status"]]
-            
-            # Size based on score
-            #sizes = filtered_data["Score"] * 200
-            sizes = 1000
-
-            scatter = ax.scatter(
-                jitter_x, jitter_y, 
-                s=sizes, 
-                c=colors,
-                edgecolors='black', 
-                linewidth=1.2, 
-                alpha=0.9
-            )
-            
-            # Add ID labels
-            for i, (x, y, id_val) in enumerate(zip(jitter_x, jitter_y, filtered_data["ID"])):
-                ax.text(x, y, str(int(id_val)), 
-                       fontsize=9, ha='center', va='center', 
-                       weight='bold', color='white')
-            
-            # Add legend for status colors
-            from matplotlib.lines import Line2D
-            legend_elements = [
-                Line2D([0], [0], marker='o', color='w', markerfacecolor=color, 
-                       label=status, markersize=10)
-                for status, color in status_colors.items() 
-                if status in filtered_data["Status"].values
-            ]
-            
-            ax.legend(handles=legend_elements, title="Status", 
-                     loc='upper left', bbox_to_anchor=(1, 1))
-            
-            plt.tight_layout()
-            st.pyplot(fig)
+            # Rendering is cached on a hash of the plotted columns, so reruns with
+            # unchanged filters (tab switches, download clicks) skip matplotlib
+            heatmap_data = filtered_data[["Complexity", "Impact", "ID", "Score", "Status"]]
+            display_png, download_png = _render_heatmap_png(hash_frame(heatmap_data), heatmap_data)
+            st.image(display_png)
             
             # Download heatmap
-            buf = io.BytesIO()
-            fig.savefig(buf, format='png', dpi=300, bbox_inches='tight')
-            buf.seek(0)
-            
             st.download_button(
                 "🖼️ Download Heatmap",
-                data=buf.getvalue(),
+                data=download_png,
                 file_name=f"heatmap_{datetime.now().strftime('%Y%m%d_%H%M')}.png",
                 mime="image/png"
             )
@@ -755,96 +981,44 @@ def visualization_page(data, lang="en"):
         with chart_tabs[1]:
             st.subheader("Priority Distribution")
             
-            # Create a priority category
-            filtered_data['Priority'] = pd.cut(
+            # Order for the priorities
+            order = ['High', 'Medium-High', 'Medium-Low', 'Low']
+            
+            # Count priority categories (kept separate so filtered_data is not modified),
+            # reindexed straight into display order
+            priority_counts = pd.cut(
                 filtered_data['Score'],
                 bins=[0, 4, 6, 8, 10],
                 labels=['Low', 'Medium-Low', 'Medium-High', 'High']
-            )
-            
-            # Create bar chart of priorities
-            priority_counts = filtered_data['Priority'].value_counts().reset_index()
+            ).value_counts().reindex(order, fill_value=0).reset_index()
             priority_counts.columns = ['Priority', 'Count']
             
-            # Order for the priorities
-            order = ['High', 'Medium-High', 'Medium-Low', 'Low']
-            priority_counts['Priority'] = pd.Categorical(
-                priority_counts['Priority'], 
-                categories=order, 
-                ordered=True
+            # Create bar chart (the spec is cached on the counts)
+            priority_chart = _priority_chart(
+                tuple(zip(priority_counts['Priority'], priority_counts['Count'])), tuple(order)
             )
-            priority_counts = priority_counts.sort_values('Priority')
             
-            # Create bar chart
-            priority_chart = alt.Chart(priority_counts).mark_bar().encode(
-                x=alt.X('Priority:N', sort=order),
-                y='Count:Q',
-                color=alt.Color('Priority:N', scale=alt.Scale(
-                    domain=['High', 'Medium-High', 'Medium-Low', 'Low'],
-                    range=['#c6f5d3', '#d4f5b3', '#fff3b3', '#f8d3d3']
-                ))
-            ).properties(height=300)
-            
-            st.altair_chart(priority_chart, use_container_width=True)
+            st.vega_lite_chart(spec=priority_chart, use_container_width=True)
         
         with chart_tabs[2]:
             st.subheader("Status Breakdown")
             
             # Create donut chart for status
-            status_counts = filtered_data['Status'].value_counts().reset_index()
+            status_counts = filtered_data['Status'].value_counts()
+            # Categorical counts include unused statuses; keep them out of the pie
+            status_counts = status_counts[status_counts > 0].reset_index()
             status_counts.columns = ['Status', 'Count']
             
-            fig, ax = plt.subplots(figsize=(8, 8))
-            
-            # Custom colors for each status
-            status_colors_pie = {
-                "Idea": "#aaaaaa",
-                "To explore": "#6baed6",
-                "Validated": "#fd8d3c",
-                "In development": "#9e9ac8",
-                "Deployed": "#74c476"
-            }
+            st.image(_render_status_donut_png(tuple(zip(status_counts['Status'], status_counts['Count']))))
             
-            # Map colors to the statuses in our data
-            colors = [status_colors_pie.get(s, "#999999") for s in status_counts['Status']]
+            # Add a table with status counts and percentages (formatted by the frontend)
+            status_counts['Percentage'] = status_counts['Count'] / status_counts['Count'].sum() * 100
             
-            # Create donut chart
-            wedges, texts, autotexts = ax.pie(
-                status_counts['Count'], 
-                labels=status_counts['Status'],
-                colors=colors,
-                autopct='%1.1f%%',
-                startangle=90,
-                wedgeprops={'edgecolor': 'white', 'linewidth': 2}
+            st.dataframe(
+                status_counts,
+                column_config={'Percentage': st.column_config.NumberColumn(format="%.1f%%")},
+                use_container_width=True, hide_index=True
             )
-            
-            # Make donut hole
-            circle = plt.Circle((0, 0), 0.4, fc='white')
-            ax.add_artist(circle)
-            
-            # Equal aspect ratio ensures that pie is drawn as a circle
-            ax.set_aspect('equal')
-            
-            # Style the text
-            for text in texts:
-                text.set_fontsize(12)
-                text.set_fontweight('bold')
-            
-            for autotext in autotexts:
-                autotext.set_fontsize(10)
-                autotext.set_fontweight('bold')
-                autotext.set_color('white')
-            
-            ax.set_title('Status Distribution', fontsize=16, pad=20)
-            
-            st.pyplot(fig)
-            
-            # Add a table with status counts and percentages
-            status_table = status_counts.copy()
-            status_table['Percentage'] = (status_table['Count'] / status_table['Count'].sum() * 100).round(1)
-            status_table['Percentage'] = status_table['Percentage'].astype(str) + '%'
-            
-            st.dataframe(status_table, use_container_width=True, hide_index=True)
 
 def export_page(data, lang="en"):
     """Render the export page"""
@@ -881,11 +1055,13 @@ def export_page(data, lang="en"):
                 default=[]
             )
         
-        export_data = data[
-            data["Type"].isin(types) & 
-            data["Area"].isin(areas) & 
-            data["Status"].isin(status_filter)
-        ]
+        # One combined mask; the Area test is skipped when every area is selected
+        mask = data["Type"].isin(types)
+        mask &= data["Status"].isin(status_filter)
+        if not select_all_areas:
+            mask &= data["Area"].isin(areas)
+        
+        export_data = data[mask].sort_values("Score", ascending=False, kind="mergesort")
     else:
         export_data = data
     
@@ -896,7 +1072,9 @@ def export_page(data, lang="en"):
         export_tabs = st.tabs(["CSV", "Excel", "JSON", "Preview"])
         
         with export_tabs[0]:
-            csv_data = export_data.to_csv(index=False).encode('utf-8')
+            # Encode into the buffer chunk by chunk instead of building the full str first
+            csv_data = io.BytesIO()
+            export_data.to_csv(csv_data, index=False, encoding='utf-8', chunksize=10_000)
             
             col1, col2 = st.columns([1, 2])
             with col1:
@@ -917,58 +1095,43 @@ def export_page(data, lang="en"):
             try:
                 import openpyxl
                 from openpyxl.styles import PatternFill, Font, Alignment
+                from openpyxl.formatting.rule import CellIsRule
+                from openpyxl.utils import get_column_letter
                 
-                # Create a writer with openpyxl
-                writer = pd.ExcelWriter(output, engine='openpyxl')
-                export_data.to_excel(writer, index=False, sheet_name='Opportunities')
-                
-                # Get the openpyxl workbook and worksheet
-                workbook = writer.book
-                worksheet = writer.sheets['Opportunities']
-                
-                # Define fills for different score ranges
-                high_fill = PatternFill(start_color="C6F5D3", end_color="C6F5D3", fill_type="solid")
-                med_fill = PatternFill(start_color="FFF3B3", end_color="FFF3B3", fill_type="solid")
-                low_fill = PatternFill(start_color="F8D3D3", end_color="F8D3D3", fill_type="solid")
-                
-                # Format header row
-                header_font = Font(bold=True, size=12)
-                for cell in worksheet[1]:
-                    cell.font = header_font
-                    cell.alignment = Alignment(horizontal='center')
-                
-                # Color code based on score
-                score_col = COLUMNS.index("Score") + 1  # +1 because openpyxl is 1-indexed
-                
-                for row in range(2, len(export_data) + 2):  # +2 to account for header and 1-indexing
-                    score_cell = worksheet.cell(row=row, column=score_col)
-                    score_value = score_cell.value
+                # Create a writer with openpyxl; the workbook is saved when the block exits
+                with pd.ExcelWriter(output, engine='openpyxl') as writer:
+                    export_data.to_excel(writer, index=False, sheet_name='Opportunities')
                     
-                    if score_value > 8:
-                        score_cell.fill = high_fill
-                    elif score_value >= 6:
-                        score_cell.fill = med_fill
-                    else:
-                        score_cell.fill = low_fill
-                
-                # Auto-adjust column widths
-                for column in worksheet.columns:
-                    max_length = 0
-                    column_letter = column[0].column_letter
+                    # Get the openpyxl workbook and worksheet
+                    workbook = writer.book
+                    worksheet = writer.sheets['Opportunities']
                     
-                    for cell in column:
-                        try:
-                            if len(str(cell.value)) > max_length:
-                                max_length = len(str(cell.value))
-                        except:
-                            pass
+                    # Define fills for different score ranges
+                    high_fill = PatternFill(start_color="C6F5D3", end_color="C6F5D3", fill_type="solid")
+                    med_fill = PatternFill(start_color="FFF3B3", end_color="FFF3B3", fill_type="solid")
+                    low_fill = PatternFill(start_color="F8D3D3", end_color="F8D3D3", fill_type="solid")
                     
-                    # Limit width to 50 characters
-                    adjusted_width = min(max_length + 2, 50)
-                    worksheet.column_dimensions[column_letter].width = adjusted_width
-                
-                # Save the workbook
-                writer.close()
+                    # Format header row
+                    header_font = Font(bold=True, size=12)
+                    for cell in worksheet[1]:
+                        cell.font = header_font
+                        cell.alignment = Alignment(horizontal='center')
+                    
+                    # Color code based on score with rules Excel evaluates on open
+                    score_col = get_column_letter(export_data.columns.get_loc("Score") + 1)  # +1 because openpyxl is 1-indexed
+                    score_range = f"{score_col}2:{score_col}{len(export_data) + 1}"  # Row 1 is the header
+                    
+                    worksheet.conditional_formatting.add(score_range, CellIsRule(operator='greaterThan', formula=['8'], fill=high_fill))
+                    worksheet.conditional_formatting.add(score_range, CellIsRule(operator='between', formula=['6', '8'], fill=med_fill))
+                    worksheet.conditional_formatting.add(score_range, CellIsRule(operator='lessThan', formula=['6'], fill=low_fill))
+                    
+                    # Auto-adjust column widths from the data rather than the written cells
+                    for i, column in enumerate(export_data.columns, start=1):
+                        max_length = max(export_data[column].astype(str).str.len().max(), len(column))
+                        
+                        # Limit width to 50 characters
+                        adjusted_width = min(max_length + 2, 50)
+                        worksheet.column_dimensions[get_column_letter(i)].width = adjusted_width
                 
                 col1, col2 = st.columns([1, 2])
                 with col1:
@@ -996,7 +1159,7 @@ def export_page(data, lang="en"):
         
         with export_tabs[2]:
             # JSON export
-            json_data = export_data.to_json(orient='records', indent=2)
+            json_data = _export_json(hash_frame(export_data), export_data)
             
             col1, col2 = st.columns([1, 2])
             with col1:
@@ -1017,14 +1180,20 @@ def export_page(data, lang="en"):
             
             # Summary stats
             st.subheader("Summary Statistics")
+            scores = export_data['Score']
+            score_stats = scores.agg(['mean', 'max', 'min'])
+            # Left-closed bins: < 6 is low, 6 to < 8 is medium, >= 8 is high
+            priority_counts = pd.cut(
+                scores, bins=[-np.inf, 6, 8, np.inf], right=False, labels=['Low', 'Medium', 'High']
+            ).value_counts()
             summary = pd.DataFrame({
                 'Total Opportunities': [len(export_data)],
-                'Average Score': [export_data['Score'].mean()],
-                'Highest Score': [export_data['Score'].max()],
-                'Lowest Score': [export_data['Score'].min()],
-                'High Priority Count': [len(export_data[export_data['Score'] >= 8])],
-                'Medium Priority Count': [len(export_data[(export_data['Score'] >= 6) & (export_data['Score'] < 8)])],
-                'Low Priority Count': [len(export_data[export_data['Score'] < 6])]
+                'Average Score': [score_stats['mean']],
+                'Highest Score': [score_stats['max']],
+                'Lowest Score': [score_stats['min']],
+                'High Priority Count': [priority_counts['High']],
+                'Medium Priority Count': [priority_counts['Medium']],
+                'Low Priority Count': [priority_counts['Low']]
             })
             
             st.dataframe(summary.T, use_container_width=True)
@@ -1113,14 +1282,14 @@ def settings_page(lang="en"):
     # Backup management
     st.header("🔄 Backup Management")
     
-    # List available backups
-    backups = sorted(Path(BACKUP_FOLDER).glob("*.csv"), key=os.path.getmtime, reverse=True)
+    # List available backups, newest first, reusing the mtimes from the directory scan
+    backups = sorted(scan_backups(), reverse=True)
     
     if backups:
         backup_options = {}
-        for backup in backups:
-            timestamp = datetime.fromtimestamp(os.path.getmtime(backup)).strftime("%Y-%m-%d %H:%M:%S")
-            backup_options[str(backup)] = f"{timestamp} ({backup.name})"
+        for mtime, backup in backups:
+            timestamp = datetime.fromtimestamp(mtime).strftime("%Y-%m-%d %H:%M:%S")
+            backup_options[backup] = f"{timestamp} ({os.path.basename(backup)})"
         
         selected_backup = st.selectbox(
             "Available backups",
@@ -1133,30 +1302,26 @@ def settings_page(lang="en"):
         with col1:
             if st.button("Restore Selected Backup"):
                 # Load the backup
-                backup_df = pd.read_csv(selected_backup)
+                backup_df = read_backup(selected_backup)
                 
                 # Create a backup of current data first
                 if Path(DATA_FILE).exists():
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    current_backup = os.path.join(BACKUP_FOLDER, f"pre_restore_backup_{timestamp}.csv")
-                    st.session_state.data.to_csv(current_backup, index=False)
+                    create_backup(st.session_state.data, prefix="pre_restore_backup")
                 
-                # Restore the backup
-                st.session_state.data = backup_df
-                save_data(st.session_state.data)
+                # Restore the backup, reloading it so every row gets a UUID key
+                save_data(backup_df)
+                st.session_state.data = load_data()
                 st.success("✅ Backup restored successfully!")
                 st.rerun()
         
         with col2:
             if st.button("Download Selected Backup"):
-                with open(selected_backup, "rb") as f:
-                    backup_data = f.read()
-                
+                # The file is only read when the download is actually clicked
                 st.download_button(
                     "📥 Download Backup",
-                    data=backup_data,
+                    data=Path(selected_backup).read_bytes,
                     file_name=os.path.basename(selected_backup),
-                    mime="text/csv"
+                    mime="text/csv" if selected_backup.endswith(".csv") else "application/octet-stream"
                 )
     else:
         st.info("No backups available")
@@ -1164,18 +1329,12 @@ def settings_page(lang="en"):
     # Restore from file upload
     st.subheader("Restore from File")
     
-    uploaded_file = st.file_uploader("Upload a backup CSV file", type=["csv"])
+    uploaded_file = st.file_uploader("Upload a backup file (CSV or Parquet)", type=["csv", "parquet"])
     
     if uploaded_file is not None:
         try:
-            # Create a backup of current data first
-            if Path(DATA_FILE).exists() and not st.session_state.data.empty:
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                current_backup = os.path.join(BACKUP_FOLDER, f"pre_upload_backup_{timestamp}.csv")
-                st.session_state.data.to_csv(current_backup, index=False)
-            
             # Load the uploaded file
-            uploaded_df = pd.read_csv(uploaded_file)
+            uploaded_df = read_backup(uploaded_file)
             
             # Validate columns
             missing_cols = [col for col in COLUMNS if col not in uploaded_df.columns]
@@ -1188,8 +1347,12 @@ def settings_page(lang="en"):
                 st.dataframe(uploaded_df.head(), use_container_width=True)
                 
                 if st.button("Confirm Restore from Uploaded File"):
-                    st.session_state.data = uploaded_df
-                    save_data(st.session_state.data)
+                    # Create a backup of current data first (only once, not on every rerun)
+                    if Path(DATA_FILE).exists() and not st.session_state.data.empty:
+                        create_backup(st.session_state.data, prefix="pre_upload_backup")
+                    
+                    save_data(uploaded_df)
+                    st.session_state.data = load_data()
                     st.success("✅ Data restored from uploaded file!")
                     st.rerun()
         
@@ -1212,15 +1375,15 @@ def settings_page(lang="en"):
             if st.button("🔄 Reset All Data", type="primary", disabled=not reset_confirmation):
                 if reset_confirmation:
                     # Create one final backup before reset
+                    final_backup = None
                     if Path(DATA_FILE).exists() and not st.session_state.data.empty:
-                        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                        final_backup = os.path.join(BACKUP_FOLDER, f"final_backup_before_reset_{timestamp}.csv")
-                        st.session_state.data.to_csv(final_backup, index=False)
+                        final_backup = create_backup(st.session_state.data, prefix="final_backup_before_reset")
                     
                     # Reset the data
                     st.session_state.data = pd.DataFrame(columns=COLUMNS)
-                    if Path(DATA_FILE).exists():
-                        Path(DATA_FILE).unlink()
+                    for data_file in [DATA_FILE, LEGACY_DATA_FILE]:
+                        if Path(data_file).exists():
+                            Path(data_file).unlink()
                     
                     # Reset other session state variables
                     st.session_state.save_counter = 0
@@ -1228,15 +1391,12 @@ def settings_page(lang="en"):
                     st.success("🔄 All data has been completely reset. A backup was created before deletion.")
                     
                     # Create a download link for the backup
-                    if Path(final_backup).exists():
-                        with open(final_backup, "rb") as f:
-                            backup_data = f.read()
-                        
+                    if final_backup and Path(final_backup).exists():
                         st.download_button(
                             "📥 Download Backup of Deleted Data",
-                            data=backup_data,
+                            data=Path(final_backup).read_bytes,
                             file_name=os.path.basename(final_backup),
-                            mime="text/csv"
+                            mime="application/octet-stream"
                         )
                     
                     # Add a short delay before rerun to ensure the user sees the success message
@@ -1373,7 +1533,7 @@ def main():
             # Opportunity count by status
             status_counts = st.session_state.data["Status"].value_counts()
             for status in STATUS_OPTIONS:
-                if status in status_counts:
+                if status_counts.get(status, 0):
                     st.markdown(f"**{status}:** {status_counts[status]}")
             
             # Last modification